@@ -16,33 +16,259 @@ Usage in chat:
 - "voice: help" - Shows usage instructions
 """
 
+import atexit
 import os
+import re
 import sys
+import codecs
+import hashlib
 import json
-import tempfile
+import math
+import shutil
 import subprocess
 import signal
+import threading
+import time
+import wave
+from array import array
+from collections import OrderedDict, deque
 from pathlib import Path
 
 # Configuration
 VOXTRAL_BIN = Path.home() / ".openclaw/workspace/voxtral.c/voxtral"
 VOXTRAL_MODEL = Path.home() / ".openclaw/workspace/voxtral.c/voxtral-model"
+VOXTRAL_MODEL_INT8 = Path.home() / ".openclaw/workspace/voxtral.c/voxtral-model-int8"
+VOXTRAL_MODEL_FP16 = Path.home() / ".openclaw/workspace/voxtral.c/voxtral-model-fp16"
+QUANTIZED_MODELS = {"int8": VOXTRAL_MODEL_INT8, "fp16": VOXTRAL_MODEL_FP16}
+COMPUTE_TYPES = ("auto", "int8", "fp16", "fp32")
 DEFAULT_AUDIO_FORMAT = "wav"
 DEFAULT_SAMPLE_RATE = 16000
 DEFAULT_CHANNELS = 1
+WAV_HEADER_BYTES = 44  # Canonical PCM WAV header written by sox
+DICTATE_SECONDS = 300  # Maximum length of a "dictate" recording
+DICTATE_SILENCE_SECONDS = 3.0  # Silence after speech that ends a dictation
+CAPTURE_FRAME_MS = 20  # Ring buffer frame size
+CAPTURE_RING_SECONDS = DICTATE_SECONDS  # Audio kept by the background capture
+CAPTURE_START_TIMEOUT = 1.0  # Seconds to wait for the first captured frame
+SILENCE_THRESHOLD = 0.01  # RMS level (fraction of full scale) counted as speech
+SILENCE_STOP_SECONDS = 1.0  # Silence after speech that ends a recording
+SILENCE_PAD_MS = 200  # Audio kept around detected speech when trimming
+MAX_SEGMENT_SECONDS = 30  # Longer recordings are split at pauses
+MIN_PAUSE_MS = 100  # Shortest silence treated as a split point
+VAD_FRAME_MS = 30  # Frame size for voice activity detection
+MAX_BATCH_CLIPS = 10  # Upper bound for "record N clips"
+TRANSCRIPT_CACHE_SIZE = 128  # Transcripts remembered by audio content hash
+SERVER_END_MARKER = "<<<END>>>"  # Line the Voxtral server prints after each transcript
+
+# Child processes are launched with close_fds=False and an absolute program
+# path so CPython can use posix_spawn() (vfork) instead of fork() + exec().
+# This is safe because Python creates file descriptors non-inheritable.
+
+
+def _env_workers(default: int = 2) -> int:
+    """Read VOXTRAL_WORKERS, falling back to `default` and never below 1."""
+    try:
+        return max(1, int(os.environ.get("VOXTRAL_WORKERS", default)))
+    except ValueError:
+        print(f"Ignoring invalid VOXTRAL_WORKERS, using {default}", file=sys.stderr)
+        return default
+
+
+TRANSCRIBE_WORKERS = _env_workers()  # Parallel Voxtral processes for long recordings
+
+
+class _MicCapture:
+    """
+    Long-running sox `rec` process feeding raw PCM into a ring buffer.
+    
+    Opening the audio device costs a few hundred milliseconds per `rec`
+    launch, so the device is opened once and each recording slices the
+    frames captured since it started.
+    """
+    
+    frame_bytes = DEFAULT_SAMPLE_RATE * DEFAULT_CHANNELS * 2 * CAPTURE_FRAME_MS // 1000
+    
+    def __init__(self, seconds: int = CAPTURE_RING_SECONDS):
+        self._frames: deque[bytes] = deque(maxlen=seconds * 1000 // CAPTURE_FRAME_MS)
+        self._levels: deque[float] = deque(maxlen=self._frames.maxlen)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._first_frame = threading.Event()
+        self._proc: subprocess.Popen | None = None
+    
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+    
+    def start(self) -> bool:
+        """
+        Start the capture process if needed. Returns False if it cannot run.
+        
+        The capture is only attempted once: if `rec` fails to deliver audio,
+        or exits later, callers fall back to one-off recordings for good.
+        """
+        if self.alive:
+            return True
+        if self._proc is not None:
+            return False
+        
+        cmd = [
+            "rec", "-q",
+            "-r", str(DEFAULT_SAMPLE_RATE),
+            "-c", str(DEFAULT_CHANNELS),
+            "-b", "16",
+            "-e", "signed-integer",
+            "-t", "raw", "-"
+        ]
+        try:
+            # Own session so Ctrl+C in the terminal does not stop the capture
+            self._proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except OSError as e:
+            print(f"Background capture unavailable: {e}", file=sys.stderr)
+            return False
+        
+        threading.Thread(target=self._read_frames, args=(self._proc,), daemon=True).start()
+        atexit.register(self.stop)
+        
+        # rec exits right away if the microphone is unavailable or denied
+        deadline = time.monotonic() + CAPTURE_START_TIMEOUT
+        while not self._first_frame.wait(timeout=0.05):
+            if not self.alive or time.monotonic() > deadline:
+                print("Background capture produced no audio", file=sys.stderr)
+                self.stop()
+                return False
+        return True
+    
+    def _read_frames(self, proc: subprocess.Popen):
+        while frame := proc.stdout.read(self.frame_bytes):
+            samples = array("h", frame[:len(frame) // 2 * 2])
+            level = math.sqrt(sum(x * x for x in samples) / len(samples)) if samples else 0.0
+            with self._lock:
+                self._frames.append(frame)
+                self._levels.append(level)
+                self._count += 1
+            self._first_frame.set()
+    
+    def mark(self) -> int:
+        """Return a position to later pass to `frames_since`."""
+        with self._lock:
+            return self._count
+    
+    def levels_since(self, mark: int) -> list[float]:
+        """Return the RMS level of each frame captured since `mark`."""
+        with self._lock:
+            n = min(self._count - mark, len(self._levels))
+            return list(self._levels)[len(self._levels) - n:]
+    
+    def frames_since(self, mark: int, seconds: float) -> bytes:
+        """Return up to `seconds` of PCM captured since `mark`."""
+        limit = int(seconds * 1000) // CAPTURE_FRAME_MS
+        with self._lock:
+            start = len(self._frames) - min(self._count - mark, len(self._frames))
+            frames = list(self._frames)[start:start + limit]
+        return b"".join(frames)
+    
+    def stop(self):
+        if self.alive:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
 
 
 class VoxtralSkill:
     """Voice input skill using Voxtral speech-to-text."""
     
-    def __init__(self):
+    def __init__(self, compute_type: str | None = None):
+        """
+        Args:
+            compute_type: "int8", "fp16", "fp32" or "auto" (default, from
+                VOXTRAL_COMPUTE_TYPE). "auto" prefers the smallest quantized
+                model that is installed.
+                
+        Raises:
+            ValueError: If compute_type is not one of COMPUTE_TYPES
+        """
         self.voxtral_bin = VOXTRAL_BIN
-        self.voxtral_model = VOXTRAL_MODEL
+        self.compute_type = self._resolve_compute_type(compute_type)
+        self.voxtral_model = self._select_model(self.compute_type)
+        # Shared prefix of every Voxtral command line; --silent suppresses stderr output
+        self._voxtral_argv_base = [
+            str(self.voxtral_bin),
+            "-d", str(self.voxtral_model),
+            "--silent"
+        ]
+        self._help_text: str | None = None
+        if self.compute_type in QUANTIZED_MODELS and self.voxtral_model == VOXTRAL_MODEL:
+            # No quantized model file; let Voxtral convert at load time if it can
+            if self._has_flag("--compute-type"):
+                self._voxtral_argv_base += ["--compute-type", self.compute_type]
         self.temp_dir = Path.home() / ".openclaw/workspace/voxtral-recordings"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self._deps_cache: tuple[bool, str] | None = None
+        self._server: subprocess.Popen | None = None
+        self._server_lock = threading.Lock()
+        self._capture = _MicCapture()
+        self._cache_file = self.temp_dir / ".cache.json"
+        self._cache: OrderedDict[str, str] | None = None
+        self._cache_lock = threading.Lock()
+    
+    def _resolve_compute_type(self, compute_type: str | None) -> str:
+        """
+        Normalize an explicit compute type, or read VOXTRAL_COMPUTE_TYPE.
+        
+        An invalid argument raises; an invalid environment value only warns
+        and falls back to "auto".
+        """
+        if compute_type is not None:
+            value = compute_type.strip().lower()
+            if value not in COMPUTE_TYPES:
+                raise ValueError(
+                    f"Unknown compute_type {compute_type!r}, expected one of {', '.join(COMPUTE_TYPES)}"
+                )
+            return value
+        
+        value = os.environ.get("VOXTRAL_COMPUTE_TYPE", "auto").strip().lower()
+        if value not in COMPUTE_TYPES:
+            print(
+                f"Ignoring unknown VOXTRAL_COMPUTE_TYPE {value!r}, using auto "
+                f"(expected one of {', '.join(COMPUTE_TYPES)})",
+                file=sys.stderr
+            )
+            return "auto"
+        return value
+    
+    def _select_model(self, compute_type: str) -> Path:
+        """Return the model directory to use for a compute type."""
+        if compute_type == "auto":
+            for model in QUANTIZED_MODELS.values():
+                if model.exists():
+                    return model
+        elif compute_type in QUANTIZED_MODELS:
+            model = QUANTIZED_MODELS[compute_type]
+            if model.exists():
+                return model
+            print(f"No {compute_type} model at {model}, using {VOXTRAL_MODEL}", file=sys.stderr)
+        return VOXTRAL_MODEL
     
     def _check_dependencies(self) -> tuple[bool, str]:
-        """Check if required dependencies are available."""
+        """
+        Check if required dependencies are available.
+        
+        A successful result is cached for the lifetime of the skill; it is
+        only re-checked if the Voxtral binary disappears.
+        """
+        if self._deps_cache is not None and self.voxtral_bin.exists():
+            return self._deps_cache
+        self._deps_cache = None
+        
         # Check Voxtral binary
         if not self.voxtral_bin.exists():
             return False, f"Voxtral binary not found at {self.voxtral_bin}"
@@ -52,51 +278,66 @@ class VoxtralSkill:
             return False, f"Voxtral model not found at {self.voxtral_model}"
         
         # Check sox for recording
-        try:
-            subprocess.run(["which", "sox"], capture_output=True, check=True)
-        except subprocess.CalledProcessError:
+        if shutil.which("sox") is None:
             return False, "sox not found. Install with: brew install sox"
         
-        return True, "OK"
+        self._deps_cache = (True, "OK")
+        return self._deps_cache
     
-    def _record_audio(self, duration: int = 10, timeout: int = 15) -> Path | None:
+    def _record_audio(
+        self, duration: int = 10, timeout: int = 15, silence: float = SILENCE_STOP_SECONDS
+    ) -> Path | None:
         """
         Record audio from microphone using sox.
         
+        Uses the background capture when it can run, otherwise launches a
+        one-off `rec` process.
+        
         Args:
             duration: Maximum recording duration in seconds
             timeout: Timeout for recording command
+            silence: Seconds of silence after speech that end the recording
             
         Returns:
             Path to recorded audio file, or None on failure
         """
-        timestamp = int(Path.home() / ".openclaw/workspace".stat().st_mtime * 1000)
+        timestamp = time.time_ns()
         output_file = self.temp_dir / f"recording_{timestamp}.wav"
         
-        # sox command for recording
-        cmd = [
-            "rec",
-            "-b", "16",           # 16-bit
-            "-r", str(DEFAULT_SAMPLE_RATE),  # Sample rate
-            "-c", str(DEFAULT_CHANNELS),    # Mono
-            "-e", "signed-integer",  # Signed integer
-            str(output_file),
-            "silence", "1", "0.3", "1%",    # Stop on 1 second of silence
-            str(duration)                    # Max duration
-        ]
+        if self._capture.start():
+            if self._record_from_capture(output_file, duration, silence):
+                self._trim_silence(output_file)
+                return output_file
+            print("Background capture failed, falling back to rec", file=sys.stderr)
+        
+        # sox opens a named output with O_TRUNC, which would free any reserved
+        # blocks. Write to stdout instead: the fd is opened without O_TRUNC and
+        # preallocated for the maximum duration, and since it is a regular
+        # file sox can still seek back to finish the WAV header.
+        cmd = self._rec_command(["-t", "wav", "-"], duration, silence)
+        max_bytes = WAV_HEADER_BYTES + duration * DEFAULT_SAMPLE_RATE * DEFAULT_CHANNELS * 2
         
         try:
-            # Check if we can record (sox might prompt for microphone access)
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout + 5,
-                # Don't wait for input - use silence detection
-                input="n\n"  # Answer "no" to any prompts, rely on silence detection
-            )
+            fd = os.open(str(output_file), os.O_CREAT | os.O_RDWR, 0o644)
+            try:
+                self._preallocate(fd, max_bytes)
+                # Check if we can record (sox might prompt for microphone access)
+                subprocess.run(
+                    cmd,
+                    stdout=fd,
+                    stderr=subprocess.DEVNULL,
+                    timeout=timeout + 5,
+                    # Don't wait for input - use silence detection
+                    input=b"n\n",  # Answer "no" to any prompts, rely on silence detection
+                    close_fds=False
+                )
+            finally:
+                # Drop the unused part of the reservation
+                os.ftruncate(fd, self._wav_size(fd))
+                os.close(fd)
             
             if output_file.exists() and output_file.stat().st_size > 1000:
+                self._trim_silence(output_file)
                 return output_file
             else:
                 print(f"Recording failed: file not created or too small", file=sys.stderr)
@@ -109,82 +350,757 @@ class VoxtralSkill:
             print(f"Recording error: {e}", file=sys.stderr)
             return None
     
-    def _transcribe_file(self, audio_file: Path) -> str:
+    def _preallocate(self, fd: int, nbytes: int):
+        """
+        Reserve `nbytes` for a file up front so it does not grow block by block.
+        
+        Uses posix_fallocate where available and F_PREALLOCATE on macOS.
+        Filesystems without preallocation support simply skip it.
+        """
+        try:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, nbytes)
+            elif sys.platform == "darwin":
+                import fcntl
+                import struct
+                # fstore_t: flags, posmode, offset, length, bytesalloc
+                F_ALLOCATEALL, F_PEOFPOSMODE = 0x4, 3
+                fstore = struct.pack("Iiqqq", F_ALLOCATEALL, F_PEOFPOSMODE, 0, nbytes, 0)
+                fcntl.fcntl(fd, getattr(fcntl, "F_PREALLOCATE", 42), fstore)
+        except OSError:
+            pass
+    
+    def _wav_size(self, fd: int) -> int:
+        """
+        Return the length of the WAV data sox wrote to a preallocated fd.
+        
+        Taken from the RIFF header when sox finalized it. Otherwise the
+        shared file offset marks where sox stopped writing.
+        """
+        offset = os.lseek(fd, 0, os.SEEK_CUR)
+        header = os.pread(fd, 8, 0)
+        if len(header) == 8 and header[:4] == b"RIFF":
+            size = int.from_bytes(header[4:], "little") + 8
+            if WAV_HEADER_BYTES <= size <= os.fstat(fd).st_size:
+                return max(size, offset)
+        return offset
+    
+    def _rec_command(
+        self, output: list[str], duration: int, silence: float = SILENCE_STOP_SECONDS
+    ) -> list[str]:
+        """
+        Build the sox `rec` command line.
+        
+        Args:
+            output: Output file arguments, e.g. [path] or ["-t", "wav", "-"]
+            duration: Maximum recording duration in seconds
+            silence: Seconds of silence after speech that end the recording
+        """
+        # Full path to rec so subprocess can posix_spawn
+        return [
+            shutil.which("rec") or "rec",
+            "-b", "16",           # 16-bit
+            "-r", str(DEFAULT_SAMPLE_RATE),  # Sample rate
+            "-c", str(DEFAULT_CHANNELS),    # Mono
+            "-e", "signed-integer",  # Signed integer
+            *output,
+            "silence", "1", "0.3", "1%",    # Start on speech,
+            "1", str(silence), "1%",         # stop after `silence` seconds of quiet
+            "trim", "0", str(duration)       # Max duration
+        ]
+    
+    def _record_from_capture(
+        self, output_file: Path, duration: int, silence: float = SILENCE_STOP_SECONDS
+    ) -> bool:
+        """
+        Write up to `duration` seconds from the background capture to a WAV file.
+        
+        Like the sox `silence` effect, recording stops once speech has been
+        followed by `silence` seconds of silence. Ctrl+C ends the recording
+        early and keeps what was captured.
+        """
+        mark = self._capture.mark()
+        stop_frames = int(silence * 1000) // CAPTURE_FRAME_MS
+        threshold = SILENCE_THRESHOLD * 32768
+        deadline = time.monotonic() + duration
+        try:
+            while time.monotonic() < deadline and self._capture.alive:
+                time.sleep(0.1)
+                levels = self._capture.levels_since(mark)
+                speech = [i for i, level in enumerate(levels) if level > threshold]
+                if speech and len(levels) - speech[-1] > stop_frames:
+                    break
+        except KeyboardInterrupt:
+            pass
+        
+        pcm = self._capture.frames_since(mark, duration)
+        if not pcm:
+            return False
+        
+        with wave.open(str(output_file), "wb") as out:
+            out.setnchannels(DEFAULT_CHANNELS)
+            out.setsampwidth(2)
+            out.setframerate(DEFAULT_SAMPLE_RATE)
+            out.writeframes(pcm)
+        return True
+    
+    def _trim_silence(self, audio_file: Path, hop_ms: int = 20):
+        """
+        Cut leading and trailing silence from a 16-bit WAV file in place.
+        
+        Silence is detected from the RMS of `hop_ms` windows, so Voxtral does
+        not spend time on padding. Skipped if numpy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        
+        try:
+            with wave.open(str(audio_file), "rb") as src:
+                params = src.getparams()
+                pcm = src.readframes(params.nframes)
+        except (wave.Error, EOFError):
+            return
+        if params.sampwidth != 2:
+            return
+        
+        samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, params.nchannels)
+        hop = params.framerate * hop_ms // 1000
+        n_hops = len(samples) // hop
+        if n_hops == 0:
+            return
+        
+        windows = samples[:n_hops * hop].astype(np.float32).reshape(n_hops, -1)
+        rms = np.sqrt(np.mean(windows ** 2, axis=1))
+        speech = np.flatnonzero(rms > SILENCE_THRESHOLD * 32768)
+        if len(speech) == 0:
+            return
+        
+        pad = SILENCE_PAD_MS // hop_ms
+        start = max(speech[0] - pad, 0) * hop
+        end = min((speech[-1] + 1 + pad) * hop, len(samples))
+        if start == 0 and end == len(samples):
+            return
+        
+        with wave.open(str(audio_file), "wb") as out:
+            out.setparams(params)
+            out.writeframes(samples[start:end].tobytes())
+    
+    def _transcribe_file(self, audio_file: Path, echo: bool = True) -> str:
         """
         Transcribe an audio file using Voxtral.
         
         Args:
             audio_file: Path to audio file
+            echo: Print the transcript to stderr as Voxtral produces it
             
         Returns:
-            Transcribed text
+            Transcribed text, or an error message
+        """
+        return self._run_transcription(audio_file, echo)[1]
+    
+    def _run_transcription(self, audio_file: Path, echo: bool = True) -> tuple[bool, str]:
+        """
+        Transcribe an audio file, reporting success separately from the text.
+        
+        Returns:
+            Tuple of (success, transcript or error message)
         """
         if not audio_file.exists():
-            return "Error: Audio file not found"
+            return False, "Error: Audio file not found"
         
-        cmd = [
-            str(self.voxtral_bin),
-            "-d", str(self.voxtral_model),
-            "-i", str(audio_file),
-            "--silent"  # Suppress stderr output
-        ]
+        # Key on the Voxtral command line too (model, --compute-type, ...), so
+        # transcripts from a different configuration are not reused
+        digest = hashlib.blake2b(audio_file.read_bytes(), digest_size=16)
+        for arg in self._voxtral_argv_base:
+            if arg != "--silent":
+                digest.update(arg.encode() + b"\0")
+        key = digest.hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            return True, cached
+        
+        try:
+            transcript = self._transcribe_with_server(audio_file, echo=echo)
+        except subprocess.TimeoutExpired:
+            return False, "Transcription timed out"
+        if transcript is not None:
+            self._cache_put(key, transcript)
+            return True, transcript
+        
+        cmd = self._voxtral_argv_base + ["-i", str(audio_file)]
+        
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
+        except Exception as e:
+            return False, f"Transcription error: {e}"
+        
+        output, stopped = self._stream_output(
+            proc, timeout=120, stop_signal=signal.SIGKILL, echo=echo
+        )
+        if stopped == "timeout":
+            return False, "Transcription timed out"
+        if stopped == "interrupt":
+            return False, "Transcription cancelled by user"
         
+        if proc.returncode == 0:
+            transcript = output.strip()
+            self._cache_put(key, transcript)
+            return True, transcript
+        else:
+            return False, f"Transcription error: {self._voxtral_error(cmd, proc.returncode)}"
+    
+    def _voxtral_error(self, cmd: list[str], returncode: int) -> str:
+        """
+        Re-run a failed Voxtral command with stderr captured to explain it.
+        
+        stderr is discarded on the normal path, so it is only read (and
+        decoded) once a run has already failed.
+        """
+        retry_cmd = [arg for arg in cmd if arg != "--silent"]
         try:
             result = subprocess.run(
+                retry_cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=120,
+                close_fds=False
+            )
+        except Exception:
+            return f"voxtral exited with code {returncode}"
+        lines = result.stderr.decode("utf-8", "replace").strip().splitlines()
+        return lines[-1] if lines else f"voxtral exited with code {returncode}"
+    
+    def _start_server(self) -> bool:
+        """
+        Start a persistent Voxtral server if the binary supports it.
+        
+        The server keeps the model loaded between transcriptions, so only
+        the first request pays the model load.
+        """
+        if self._server is not None and self._server.poll() is None:
+            return True
+        if not self._supports_server():
+            return False
+        
+        cmd = self._voxtral_argv_base + ["--server"]
+        try:
+            self._server = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                timeout=120
+                text=True,
+                bufsize=1,
+                close_fds=False
             )
+        except OSError as e:
+            print(f"Could not start Voxtral server: {e}", file=sys.stderr)
+            return False
+        atexit.register(self._stop_server)
+        return True
+    
+    def _stop_server(self):
+        if self._server is not None and self._server.poll() is None:
+            self._server.stdin.close()
+            try:
+                self._server.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._server.kill()
+    
+    def _transcribe_with_server(
+        self, audio_file: Path, timeout: int = 120, echo: bool = True
+    ) -> str | None:
+        """
+        Transcribe through the persistent Voxtral server.
+        
+        The server reads one audio path per line on stdin and answers with
+        the transcript followed by a SERVER_END_MARKER line. An explicit
+        marker keeps transcripts that contain empty lines intact.
+        
+        Returns:
+            Transcribed text, or None if server mode is unavailable
             
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                return f"Transcription error: {error_msg}"
-                
-        except subprocess.TimeoutExpired:
-            return "Transcription timed out"
-        except Exception as e:
-            return f"Transcription error: {e}"
+        Raises:
+            subprocess.TimeoutExpired: If the server does not answer in time
+        """
+        with self._server_lock:
+            if not self._start_server():
+                return None
+            server = self._server
+            
+            timed_out = threading.Event()
+            
+            def stop():
+                timed_out.set()
+                server.kill()
+            
+            timer = threading.Timer(timeout, stop)
+            timer.daemon = True
+            timer.start()
+            lines = []
+            line = ""
+            try:
+                server.stdin.write(f"{audio_file}\n")
+                server.stdin.flush()
+                while line := server.stdout.readline():
+                    if line.rstrip("\r\n") == SERVER_END_MARKER:
+                        break
+                    if echo:
+                        print(line, end="", file=sys.stderr, flush=True)
+                    lines.append(line)
+            except (OSError, ValueError):
+                line = ""
+            finally:
+                timer.cancel()
+            
+            if line == "":
+                # Server exited or was killed; restart it on the next request
+                self._server = None
+                server.kill()
+                server.wait()
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(server.args, timeout)
+                return None
+            return "".join(lines).strip()
+    
+    def _load_cache(self) -> OrderedDict[str, str]:
+        """Load the transcript cache from disk on first use."""
+        if self._cache is None:
+            try:
+                self._cache = OrderedDict(json.loads(self._cache_file.read_text()))
+            except (OSError, ValueError):
+                self._cache = OrderedDict()
+        return self._cache
+    
+    def _cache_get(self, key: str) -> str | None:
+        """Return the cached transcript for an audio hash, if any."""
+        with self._cache_lock:
+            cache = self._load_cache()
+            if key not in cache:
+                return None
+            cache.move_to_end(key)
+            return cache[key]
+    
+    def _cache_put(self, key: str, transcript: str):
+        """Store a transcript and write the cache back to disk."""
+        with self._cache_lock:
+            cache = self._load_cache()
+            cache[key] = transcript
+            cache.move_to_end(key)
+            while len(cache) > TRANSCRIPT_CACHE_SIZE:
+                cache.popitem(last=False)
+            
+            tmp_file = self._cache_file.with_suffix(".tmp")
+            try:
+                tmp_file.write_text(json.dumps(cache))
+                os.replace(tmp_file, self._cache_file)
+            except OSError as e:
+                print(f"Could not write transcript cache: {e}", file=sys.stderr)
+    
+    def _transcribe_files(self, audio_files: list[Path]) -> str:
+        """
+        Transcribe several recordings with a single Voxtral run.
+        
+        Voxtral takes one input per invocation, so the recordings are joined
+        into one WAV separated by a short silence. The model is then loaded
+        once instead of once per file.
+        
+        Args:
+            audio_files: Paths to WAV files with identical formats
+            
+        Returns:
+            Transcribed text of all recordings, in order
+        """
+        if len(audio_files) == 1:
+            return self._transcribe_file(audio_files[0])
+        
+        batch_file = self.temp_dir / f"batch_{time.time_ns()}.wav"
+        try:
+            self._concat_wavs(audio_files, batch_file)
+        except (wave.Error, ValueError, OSError) as e:
+            batch_file.unlink(missing_ok=True)
+            print(f"Cannot batch recordings ({e}), transcribing one by one", file=sys.stderr)
+            return "\n".join(self._transcribe_file(f) for f in audio_files)
+        
+        try:
+            return self._transcribe_file(batch_file)
+        finally:
+            batch_file.unlink(missing_ok=True)
+    
+    def _transcribe_long(self, audio_file: Path) -> str:
+        """
+        Transcribe a single recording, splitting it at pauses if it is long.
+        
+        Recordings over MAX_SEGMENT_SECONDS are cut into segments at
+        detected pauses and the segments are transcribed in parallel by
+        TRANSCRIBE_WORKERS Voxtral processes. With a persistent server the
+        segments go through it one at a time instead, which keeps the model
+        loaded rather than paying a model load per segment. Multi-clip
+        batches do not go through here, so they keep their single Voxtral run.
+        
+        Args:
+            audio_file: Path to a 16-bit WAV file
+            
+        Returns:
+            Transcribed text of all segments in order, or an error message
+            naming the first segment that failed
+        """
+        segments = self._split_on_pauses(audio_file)
+        if len(segments) <= 1:
+            return self._transcribe_file(audio_file)
+        
+        # Imported here: concurrent.futures pulls in logging, which is slow
+        # to import and only needed for long recordings
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # The server answers one request at a time, so extra workers would
+        # only queue on _server_lock
+        workers = 1 if self._supports_server() else TRANSCRIBE_WORKERS
+        print(f"📝 Transcribing {len(segments)} segments")
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(lambda f: self._run_transcription(f, echo=False), segments))
+        finally:
+            for segment in segments:
+                segment.unlink(missing_ok=True)
+        
+        for i, (ok, text) in enumerate(results):
+            if not ok:
+                return f"Segment {i + 1}/{len(segments)} failed: {text}"
+        return " ".join(text for _, text in results if text)
+    
+    def _split_on_pauses(self, audio_file: Path) -> list[Path]:
+        """
+        Split a WAV file into segments of at most MAX_SEGMENT_SECONDS.
+        
+        Cuts are placed in the middle of the last pause of MIN_PAUSE_MS or
+        more before the limit, or at the limit if there is no pause.
+        
+        Returns:
+            Paths of the segment files, or an empty list if no split is needed
+            or the file cannot be read as WAV
+        """
+        try:
+            with wave.open(str(audio_file), "rb") as src:
+                params = src.getparams()
+                pcm = src.readframes(params.nframes)
+        except (wave.Error, EOFError):
+            return []
+        if params.nframes <= MAX_SEGMENT_SECONDS * params.framerate:
+            return []
+        
+        frame_len = params.framerate * VAD_FRAME_MS // 1000
+        frame_bytes = frame_len * params.nchannels * params.sampwidth
+        speech = self._detect_speech(pcm, params, frame_bytes)
+        if speech is None:
+            return []
+        
+        max_frames = MAX_SEGMENT_SECONDS * 1000 // VAD_FRAME_MS
+        min_pause = -(-MIN_PAUSE_MS // VAD_FRAME_MS)
+        cuts = [0]
+        start = 0
+        while len(speech) - start > max_frames:
+            cut = start + max_frames
+            run = 0
+            for i in range(start + max_frames - 1, start, -1):
+                run = run + 1 if not speech[i] else 0
+                if run >= min_pause:
+                    # Extend to the whole pause and cut in its middle
+                    begin, end = i, i + run
+                    while begin > start + 1 and not speech[begin - 1]:
+                        begin -= 1
+                    cut = (begin + end) // 2
+                    break
+            cuts.append(cut)
+            start = cut
+        cuts.append(len(speech))
+        
+        segments = []
+        for i, (begin, end) in enumerate(zip(cuts, cuts[1:])):
+            segment = audio_file.with_name(f"{audio_file.stem}_part{i}.wav")
+            with wave.open(str(segment), "wb") as out:
+                out.setparams(params)
+                out.writeframes(pcm[begin * frame_bytes:end * frame_bytes])
+            segments.append(segment)
+        return segments
+    
+    def _detect_speech(self, pcm: bytes, params, frame_bytes: int) -> list[bool] | None:
+        """
+        Classify VAD_FRAME_MS frames of 16-bit PCM as speech or silence.
+        
+        Uses webrtcvad when installed, otherwise an RMS threshold with numpy.
+        Returns None if neither is available.
+        """
+        n_frames = -(-len(pcm) // frame_bytes)
+        
+        try:
+            import webrtcvad
+        except ImportError:
+            webrtcvad = None
+        if webrtcvad is not None and params.nchannels == 1 and params.sampwidth == 2:
+            vad = webrtcvad.Vad(2)
+            speech = []
+            for i in range(n_frames):
+                frame = pcm[i * frame_bytes:(i + 1) * frame_bytes]
+                # webrtcvad needs full frames; treat a short tail as speech
+                speech.append(len(frame) < frame_bytes or vad.is_speech(frame, params.framerate))
+            return speech
+        
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        if params.sampwidth != 2:
+            return None
+        
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+        samples = np.pad(samples, (0, n_frames * frame_bytes // 2 - len(samples)))
+        rms = np.sqrt(np.mean(samples.reshape(n_frames, -1) ** 2, axis=1))
+        return (rms > SILENCE_THRESHOLD * 32768).tolist()
+    
+    def _concat_wavs(self, audio_files: list[Path], output_file: Path, gap: float = 1.0):
+        """
+        Concatenate WAV files, inserting `gap` seconds of silence between them.
+        
+        Raises:
+            ValueError: If the files do not share the same audio format
+        """
+        with wave.open(str(output_file), "wb") as out:
+            params = None
+            for i, audio_file in enumerate(audio_files):
+                with wave.open(str(audio_file), "rb") as src:
+                    src_params = src.getparams()[:3]
+                    if params is None:
+                        params = src_params
+                        out.setparams(src.getparams())
+                        channels, sampwidth, framerate = params
+                        silence = b"\0" * int(gap * framerate) * channels * sampwidth
+                    elif src_params != params:
+                        raise ValueError(f"{audio_file.name} has a different format")
+                    if i > 0:
+                        out.writeframes(silence)
+                    out.writeframes(src.readframes(src.getnframes()))
     
-    def _transcribe_mic_realtime(self) -> str:
+    def _stream_output(
+        self, proc: subprocess.Popen, timeout: float, stop_signal: int, echo: bool = True
+    ) -> tuple[str, str | None]:
+        """
+        Echo a Voxtral process's stdout as it arrives and collect it.
+        
+        Voxtral prints tokens incrementally, so partial transcripts are shown
+        to the user immediately instead of after the process exits. The live
+        echo goes to stderr; stdout only carries the final result.
+        
+        Args:
+            proc: Process started with a binary stdout pipe
+            timeout: Seconds to wait before sending stop_signal
+            stop_signal: Signal used to stop the process on timeout
+            echo: Print output to stderr as it arrives
+            
+        Returns:
+            Tuple of (collected output, "timeout" / "interrupt" / None)
+        """
+        timed_out = threading.Event()
+        
+        def stop():
+            timed_out.set()
+            proc.send_signal(stop_signal)
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        
+        timer = threading.Timer(timeout, stop)
+        timer.daemon = True
+        timer.start()
+        
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        chunks = []
+        interrupted = False
+        fd = proc.stdout.fileno()
+        try:
+            while True:
+                try:
+                    data = os.read(fd, 4096)
+                except KeyboardInterrupt:
+                    # Let Voxtral flush what it has, then keep draining
+                    interrupted = True
+                    proc.send_signal(signal.SIGINT)
+                    continue
+                if not data:
+                    break
+                text = decoder.decode(data)
+                if echo:
+                    print(text, end="", file=sys.stderr, flush=True)
+                chunks.append(text)
+            chunks.append(decoder.decode(b"", final=True))
+            proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        
+        if echo and any(chunks):
+            print(file=sys.stderr)
+        if timed_out.is_set():
+            return "".join(chunks), "timeout"
+        if interrupted:
+            return "".join(chunks), "interrupt"
+        return "".join(chunks), None
+    
+    def _voxtral_help(self) -> str:
+        """Return `voxtral --help` output, probed once and cached."""
+        if self._help_text is None:
+            try:
+                result = subprocess.run(
+                    [self._voxtral_argv_base[0], "--help"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                    close_fds=False
+                )
+                self._help_text = result.stdout + result.stderr
+            except Exception:
+                self._help_text = ""
+        return self._help_text
+    
+    def _has_flag(self, flag: str) -> bool:
+        """
+        Check whether `voxtral --help` lists a flag.
+        
+        Matches the whole flag so that e.g. --server-port does not count
+        as --server.
+        """
+        pattern = rf"(?<![\w-]){re.escape(flag)}(?![\w-])"
+        return re.search(pattern, self._voxtral_help()) is not None
+    
+    def _supports_mic(self) -> bool:
+        """Check whether the Voxtral binary supports --from-mic."""
+        return self._has_flag("--from-mic")
+    
+    def _supports_stdin(self) -> bool:
+        """Check whether the Voxtral binary can read audio from --stdin."""
+        return self._has_flag("--stdin")
+    
+    def _supports_server(self) -> bool:
+        """Check whether the Voxtral binary supports --server."""
+        return self._has_flag("--server")
+    
+    def _transcribe_mic_realtime(self, max_duration: int = 60) -> str:
         """
         Use Voxtral's built-in microphone mode.
         This opens the microphone and transcribes in real-time.
         
         Note: This runs Voxtral directly with --from-mic flag.
         The user can speak and see transcription as they speak.
+        
+        Voxtral has no silence auto-stop, so recording runs for the full
+        `max_duration` unless the user presses Ctrl+C.
+        
+        Args:
+            max_duration: Recording duration in seconds. Voxtral is sent
+                SIGINT once it elapses so it can flush its transcript.
+            
+        Returns:
+            Transcribed text
         """
-        cmd = [
-            str(self.voxtral_bin),
-            "-d", str(self.voxtral_model),
-            "--from-mic",
-            "--silent"
-        ]
+        cmd = self._voxtral_argv_base + ["--from-mic"]
         
         try:
-            print("\n🎤 Speak now (press Ctrl+C when done)...\n")
-            result = subprocess.run(
+            print(
+                f"\n🎤 Speak now (records for the full {max_duration}s, "
+                "press Ctrl+C as soon as you are done)...\n"
+            )
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                timeout=60  # Max 60 seconds of recording
+                close_fds=False
             )
-            
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                return "Microphone transcription was interrupted or failed."
-                
-        except subprocess.TimeoutExpired:
-            return "Recording timed out (max 60 seconds)"
-        except KeyboardInterrupt:
-            return "Recording cancelled by user"
         except Exception as e:
             return f"Microphone error: {e}"
+        
+        # SIGINT asks Voxtral to stop listening and emit what it has so far
+        output, stopped = self._stream_output(
+            proc, timeout=max_duration, stop_signal=signal.SIGINT
+        )
+        if output.strip():
+            return output.strip()
+        if stopped == "timeout":
+            return f"Recording timed out (max {max_duration} seconds)"
+        if stopped == "interrupt":
+            return "Recording cancelled by user"
+        return "Microphone transcription was interrupted or failed."
+    
+    def _transcribe_piped(self, duration: int = 10, timeout: int = 15) -> str:
+        """
+        Record with sox and pipe the WAV straight into Voxtral's stdin.
+        
+        No intermediate file is written, and Voxtral starts decoding as soon
+        as sox produces audio.
+        
+        Args:
+            duration: Maximum recording duration in seconds
+            timeout: Timeout for recording command
+            
+        Returns:
+            Transcribed text
+        """
+        rec_cmd = self._rec_command(["-t", "wav", "-"], duration)
+        voxtral_cmd = self._voxtral_argv_base + ["--stdin"]
+        
+        try:
+            rec = subprocess.Popen(
+                rec_cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
+        except Exception as e:
+            return f"Recording error: {e}"
+        try:
+            proc = subprocess.Popen(
+                voxtral_cmd,
+                stdin=rec.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
+        except Exception as e:
+            rec.kill()
+            rec.wait()
+            return f"Transcription error: {e}"
+        finally:
+            # Only Voxtral should hold the read end, so it sees EOF when sox exits
+            rec.stdout.close()
+        
+        rec_timer = threading.Timer(timeout + 5, rec.terminate)
+        rec_timer.daemon = True
+        rec_timer.start()
+        try:
+            output, stopped = self._stream_output(
+                proc, timeout=timeout + 120, stop_signal=signal.SIGKILL
+            )
+        finally:
+            rec_timer.cancel()
+            if rec.poll() is None:
+                rec.terminate()
+            rec.wait()
+        
+        if stopped == "timeout":
+            return "Transcription timed out"
+        if stopped == "interrupt" and not output.strip():
+            return "Recording cancelled by user"
+        if proc.returncode == 0 or output.strip():
+            return output.strip()
+        return f"Transcription error: voxtral exited with code {proc.returncode}"
     
     def process_command(self, command: str) -> str:
         """
@@ -207,6 +1123,21 @@ class VoxtralSkill:
         if cmd in ["help", "--help", "-h", "usage"]:
             return self.get_help()
         
+        # Dictation: one long recording, split at pauses for transcription
+        if "dictate" in cmd:
+            print(f"🎤 Dictating (up to {DICTATE_SECONDS // 60} minutes, "
+                  f"stops after {DICTATE_SILENCE_SECONDS:g}s of silence)...")
+            audio_file = self._record_audio(
+                duration=DICTATE_SECONDS,
+                timeout=DICTATE_SECONDS + 5,
+                silence=DICTATE_SILENCE_SECONDS
+            )
+            if not audio_file:
+                return "❌ Recording failed"
+            print(f"📝 Transcribing: {audio_file.name}")
+            result = self._transcribe_long(audio_file)
+            return f"🎙️ Transcribed:\n\n{result}"
+        
         # Record and transcribe
         if "record" in cmd or "voice" in cmd:
             # Check for duration parameter
@@ -216,18 +1147,45 @@ class VoxtralSkill:
             elif "long" in cmd:
                 duration = 20
             
-            # Option 1: Record to file then transcribe
+            # Batch: "record N clips" records N clips and transcribes them together
+            match = re.search(r"record\s+(\d+)\s+clips?\b", cmd)
+            count = int(match.group(1)) if match else 1
+            if count > MAX_BATCH_CLIPS:
+                return f"❌ At most {MAX_BATCH_CLIPS} clips can be recorded at once"
+            if count > 1:
+                audio_files = []
+                for i in range(count):
+                    print(f"🎤 Recording clip {i + 1}/{count}...")
+                    audio_file = self._record_audio(duration=duration)
+                    if audio_file:
+                        audio_files.append(audio_file)
+                if not audio_files:
+                    return "❌ Recording failed"
+                print(f"📝 Transcribing {len(audio_files)} recordings")
+                result = self._transcribe_files(audio_files)
+                return f"🎙️ Transcribed:\n\n{result}"
+            
+            # Option 1: Let Voxtral capture and transcribe in one process
+            if self._supports_mic():
+                result = self._transcribe_mic_realtime(max_duration=duration)
+                return f"🎙️ Transcribed:\n\n{result}"
+            
+            # Option 2: Pipe sox straight into Voxtral
+            if self._supports_stdin():
+                print("🎤 Recording audio...")
+                result = self._transcribe_piped(duration=duration)
+                return f"🎙️ Transcribed:\n\n{result}"
+            
+            # Option 3: Record to file with sox then transcribe
             print("🎤 Recording audio...")
             audio_file = self._record_audio(duration=duration)
             
             if audio_file:
                 print(f"📝 Transcribing: {audio_file.name}")
-                result = self._transcribe_file(audio_file)
+                result = self._transcribe_long(audio_file)
                 return f"🎙️ Transcribed:\n\n{result}"
             else:
-                # Fall back to realtime mode
-                print("Trying realtime microphone mode...")
-                return self._transcribe_mic_realtime()
+                return "❌ Recording failed"
         
         # Just transcribe (if user has a file)
         if "transcribe" in cmd:
@@ -245,6 +1203,8 @@ class VoxtralSkill:
 - `voice: record my message` - Record audio and transcribe
 - `voice: quick record` - Quick 5-second recording
 - `voice: long record` - Extended 20-second recording
+- `voice: record 3 clips` - Record 3 clips and transcribe them in one pass
+- `voice: dictate` - Dictate for up to 5 minutes, stops after 3s of silence
 - `voice: transcribe` - Show transcription help
 - `voice: help` - Show this help
 